@@ -0,0 +1,7 @@
+# benchmarks/__init__.py
+#
+# Benchmark and scaling suite for the password manager.
+#
+# Run from the project root:
+#   python -m benchmarks.run --output results.json
+#   python -m benchmarks.compare baseline.json results.json
@@ -0,0 +1,117 @@
+# benchmarks/compare.py
+
+import argparse
+import json
+
+DEFAULT_THRESHOLD = 0.10  # 10% slower than baseline counts as a regression
+
+# Meta fields that make two runs incomparable when they differ.
+REQUIRED_MATCH = ["kdf_iterations"]
+# Meta fields that are reported but do not stop the comparison.
+WARN_MATCH = ["python", "platform", "sizes"]
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_meta(baseline: dict, current: dict) -> tuple[list[str], list[str]]:
+    """
+    Compare the meta sections of two runs.
+    Returns: (errors, warnings)
+    """
+    errors, warnings = [], []
+    for key in REQUIRED_MATCH + WARN_MATCH:
+        old, new = baseline.get(key), current.get(key)
+        if old != new:
+            message = f"{key} differs: {old} -> {new}"
+            (errors if key in REQUIRED_MATCH else warnings).append(message)
+    return errors, warnings
+
+
+def unmatched(baseline: dict, current: dict) -> tuple[list[str], list[str]]:
+    """
+    Find benchmarks present in only one result set.
+    Returns: (missing from current, new in current) as "group/benchmark" names.
+    """
+    old = {f"{g}/{n}" for g, benches in baseline.items() for n in benches}
+    new = {f"{g}/{n}" for g, benches in current.items() for n in benches}
+    return sorted(old - new), sorted(new - old)
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compare median timings of two result sets.
+    Returns one row per benchmark present in both, flagged if it regressed.
+    A zero baseline cannot be compared and gets a ratio of None.
+    """
+    rows = []
+    for group, benches in current.items():
+        for name, stats in benches.items():
+            base = baseline.get(group, {}).get(name)
+            if base is None:
+                continue
+            old, new = base["median"], stats["median"]
+            rows.append({
+                "group": group,
+                "benchmark": name,
+                "baseline": old,
+                "current": new,
+                "ratio": new / old if old > 0 else None,
+                "regression": old > 0 and new > old * (1 + threshold),
+            })
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", help="JSON results from the reference run.")
+    parser.add_argument("current", help="JSON results from the run being checked.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction of the baseline (default 0.10).")
+    parser.add_argument("--json", action="store_true", help="Print the comparison as JSON.")
+    args = parser.parse_args(argv)
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    errors, warnings = check_meta(baseline.get("meta", {}), current.get("meta", {}))
+    rows = compare(baseline["results"], current["results"], args.threshold)
+    regressions = [r for r in rows if r["regression"]]
+    missing, new = unmatched(baseline["results"], current["results"])
+
+    if args.json:
+        print(json.dumps({
+            "threshold": args.threshold,
+            "errors": errors,
+            "warnings": warnings,
+            "rows": rows,
+            "regressions": len(regressions),
+            "missing": missing,
+            "new": new,
+        }, indent=2))
+    else:
+        for message in errors:
+            print(f"ERROR: {message}")
+        for message in warnings:
+            print(f"WARNING: {message}")
+        if errors:
+            print("Runs are not comparable.")
+            return 2
+        for r in rows:
+            flag = "REGRESSION" if r["regression"] else ""
+            ratio = f"{r['ratio']:.2f}x" if r["ratio"] is not None else "not comparable"
+            print(f"{r['group']:>8} {r['benchmark']:<20} {r['baseline']:.6f}s -> {r['current']:.6f}s "
+                  f"({ratio}) {flag}".rstrip())
+        for name in missing:
+            print(f"MISSING: {name} (only in baseline)")
+        for name in new:
+            print(f"NEW: {name} (only in current)")
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+
+    if errors:
+        return 2
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
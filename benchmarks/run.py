@@ -0,0 +1,135 @@
+# benchmarks/run.py
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from config import KDF_ITERATIONS
+from crypto_utils import decrypt_text
+from user_manager import login_or_register
+from vault_manager import (
+    load_vault,
+    save_vault,
+    find_entry,
+    search_entries,
+    group_by_category,
+)
+from benchmarks.generator import generate_vault, isolated_storage, scripted_login, service_name
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BENCH_USER = "bench"
+BENCH_PASSWORD = "correct horse battery staple"
+
+
+def _timeit(func, repeat: int) -> dict:
+    """
+    Time `func` with an inner loop calibrated so each sample takes at least 0.2s.
+    Reported times are per call.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _decrypt_wrong_key(token: str, fernet: Fernet) -> None:
+    try:
+        decrypt_text(token, fernet)
+    except InvalidToken:
+        pass
+
+
+def bench_login(repeat: int) -> tuple[dict, Fernet]:
+    # First call registers the user, the timed calls go through authentication.
+    with scripted_login(BENCH_USER, BENCH_PASSWORD):
+        _, fernet = login_or_register()
+        results = {"login": _timeit(login_or_register, repeat)}
+    return results, fernet
+
+
+def bench_size(size: int, fernet: Fernet, repeat: int) -> tuple[dict, float]:
+    start = time.perf_counter()
+    vault = generate_vault(size, fernet)
+    generate_seconds = time.perf_counter() - start
+
+    entries = vault["entries"]
+    last = service_name(size - 1)
+    token = entries[size // 2]["password"]
+    wrong_fernet = Fernet(Fernet.generate_key())
+
+    results = {
+        "save_vault": _timeit(lambda: save_vault(BENCH_USER, vault), repeat),
+        "load_vault": _timeit(lambda: load_vault(BENCH_USER), repeat),
+        "find_entry": _timeit(lambda: find_entry(vault, last), repeat),
+        "find_entry_missing": _timeit(lambda: find_entry(vault, "does-not-exist"), repeat),
+        "search_entries": _timeit(lambda: search_entries(vault, "mail"), repeat),
+        "group_by_category": _timeit(lambda: group_by_category(vault), repeat),
+        "decrypt_one": _timeit(lambda: decrypt_text(token, fernet), repeat),
+        "decrypt_wrong_key": _timeit(lambda: _decrypt_wrong_key(token, wrong_fernet), repeat),
+        "decrypt_all": _timeit(lambda: [decrypt_text(e["password"], fernet) for e in entries], repeat),
+    }
+    return results, generate_seconds
+
+
+def run(sizes: list[int], repeat: int) -> dict:
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "kdf_iterations": KDF_ITERATIONS,
+            "repeat": repeat,
+            "sizes": sizes,
+            # Setup cost of the synthetic vaults, single sample, not compared.
+            "generate_seconds": {},
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp, isolated_storage(tmp):
+        login_results, fernet = bench_login(repeat)
+        report["results"]["global"] = login_results
+        for size in sizes:
+            print(f"Benchmarking {size} entries...", file=sys.stderr)
+            results, generate_seconds = bench_size(size, fernet, repeat)
+            report["results"][str(size)] = results
+            report["meta"]["generate_seconds"][str(size)] = generate_seconds
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the password manager benchmark suite.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Vault sizes (number of entries) to benchmark.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument("--output", "-o", help="Write JSON results to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or any(s < 1 for s in args.sizes):
+        parser.error("--repeat and --sizes must be positive")
+
+    report = run(args.sizes, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+# tests/test_benchmarks_compare.py
+
+from benchmarks.compare import check_meta, compare, unmatched
+
+
+def _results(**medians) -> dict:
+    return {"1000": {name: {"median": value} for name, value in medians.items()}}
+
+
+def test_threshold_edge():
+    baseline = _results(at_limit=2.0, over_limit=2.0)
+    current = _results(at_limit=2.2, over_limit=2.21)
+    rows = {r["benchmark"]: r for r in compare(baseline, current, threshold=0.10)}
+    assert not rows["at_limit"]["regression"]
+    assert rows["over_limit"]["regression"]
+
+
+def test_zero_baseline_is_not_comparable():
+    rows = compare(_results(a=0.0, b=0.0), _results(a=0.0, b=1.0))
+    assert all(r["ratio"] is None for r in rows)
+    assert not any(r["regression"] for r in rows)
+
+
+def test_benchmark_on_one_side_only():
+    baseline = _results(shared=1.0, removed=1.0)
+    current = _results(shared=1.0, added=1.0)
+    rows = compare(baseline, current)
+    assert [r["benchmark"] for r in rows] == ["shared"]
+    assert unmatched(baseline, current) == (["1000/removed"], ["1000/added"])
+
+
+def test_kdf_iterations_mismatch_is_an_error():
+    errors, warnings = check_meta(
+        {"kdf_iterations": 390_000, "python": "3.11.7"},
+        {"kdf_iterations": 100_000, "python": "3.12.0"},
+    )
+    assert errors == ["kdf_iterations differs: 390000 -> 100000"]
+    assert warnings == ["python differs: 3.11.7 -> 3.12.0"]